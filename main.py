@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6.QtWidgets import QApplication
 
@@ -13,8 +15,17 @@ from src.ui import MemoWindow
 
 def main() -> int:
     """Initialize the database and launch the application."""
-    initialize_storage(DATABASE_PATH, LEGACY_JSON_PATH)
-    app = QApplication(sys.argv)
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+    # 数据库初始化（含旧版 JSON 迁移）与 Qt 插件加载互不依赖，放到后台线程并行进行；
+    # 缓存的写连接允许跨线程使用，由 storage 内部的锁串行化
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        storage_ready = executor.submit(
+            initialize_storage, DATABASE_PATH, LEGACY_JSON_PATH
+        )
+        app = QApplication(sys.argv)
+        storage_ready.result()
     app.setQuitOnLastWindowClosed(False)
     window = MemoWindow()
     window.resize(520, 520)
@@ -14,39 +14,52 @@ from pathlib import Path
 from PySide6.QtCore import QObject, Signal, Slot
 
 from src import storage
-from src.constants import DATABASE_PATH
+from src.constants import DATABASE_PATH, HISTORY_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
 
 
 class DBWorker(QObject):
     """Worker running in a dedicated QThread to perform DB tasks.
 
     Signals:
-        entries_loaded: emitted with list[JournalEntry] when load completes
+        entries_loaded: emitted with the newest page of list[JournalEntry]
+        page_loaded: emitted with the next older page of list[JournalEntry]
         append_failed: emitted with str message when append fails
         load_failed: emitted with str message when load fails
-        append_succeeded: emitted with no args when append succeeded
+        append_succeeded: emitted with the inserted JournalEntry when append succeeded
+        export_succeeded: emitted with (row count, target Path) when export completes
+        export_failed: emitted with str message when export fails
     """
 
     entries_loaded = Signal(object)  # will send list[JournalEntry]
+    page_loaded = Signal(object)  # will send list[JournalEntry]
     append_failed = Signal(str)
     load_failed = Signal(str)
-    append_succeeded = Signal()
+    append_succeeded = Signal(object)  # will send the new JournalEntry
+    export_succeeded = Signal(int, object)  # rows exported, target Path
+    export_failed = Signal(str)
 
     def __init__(self) -> None:
         super().__init__()
 
     @Slot(object)
     def load_entries(self, payload=None) -> None:
-        """Load entries from DB (runs in worker thread) and emit results.
+        """Load one page of entries from DB (runs in worker thread) and emit it.
 
-        payload is unused but accepted so connections can pass a dummy arg.
+        payload is None for the newest page (emitted via entries_loaded) or a
+        dict with "before" set to the (timestamp, id) of the last entry already
+        shown, in which case the next older page is emitted via page_loaded.
         """
+        payload = payload or {}
+        before = payload.get("before")
         try:
-            # determine db_path: payload may contain a Path or None -> fallback to constants
-            db_path = payload if isinstance(payload, Path) else DATABASE_PATH
-            entries = storage.load_journal_entries(db_path)
+            db_path = payload.get("db_path") or DATABASE_PATH
+            entries = storage.load_journal_page(
+                db_path, before, payload.get("limit", HISTORY_PAGE_SIZE)
+            )
         except Exception as exc:  # defensive: emit failure and return
-            logging.exception("DBWorker failed to load entries")
+            logger.exception("DBWorker failed to load entries")
             try:
                 self.load_failed.emit(str(exc))
             except Exception:
@@ -55,13 +68,16 @@ class DBWorker(QObject):
 
         # emit loaded entries to UI thread
         try:
-            self.entries_loaded.emit(entries)
+            if before is None:
+                self.entries_loaded.emit(entries)
+            else:
+                self.page_loaded.emit(entries)
         except Exception:
-            logging.exception("Failed to emit entries_loaded signal")
+            logger.exception("Failed to emit loaded entries")
 
     @Slot(object)
     def append_entry(self, payload) -> None:
-        """Append an entry to DB using a payload dict; then load entries.
+        """Append an entry to DB using a payload dict and emit the new entry.
 
         The payload should contain the same args that storage.append_entry_to_journal
         expects (text, mood, db_path, body_sensation, trigger_event,
@@ -79,7 +95,7 @@ class DBWorker(QObject):
             energy_level = int(payload.get("energy_level", 3))
 
             # call storage append but do NOT provide the UI cache (avoid cross-thread mutation)
-            storage.append_entry_to_journal(
+            new_entry = storage.append_entry_to_journal(
                 text,
                 mood,
                 db_path,
@@ -91,26 +107,38 @@ class DBWorker(QObject):
                 cache=None,
             )
         except Exception as exc:
-            logging.exception("DBWorker failed to append entry")
+            logger.exception("DBWorker failed to append entry")
             try:
                 self.append_failed.emit(str(exc))
             except Exception:
                 pass
             return
 
-        # notify success and then refresh entries list
+        # hand the single new entry back; the UI splices it in without a reload
         try:
-            self.append_succeeded.emit()
+            self.append_succeeded.emit(new_entry)
         except Exception:
-            logging.exception("Failed to emit append_succeeded")
+            logger.exception("Failed to emit append_succeeded")
 
-        # reload entries and emit them (so UI can update cache and list)
+    @Slot(object)
+    def export_entries(self, payload) -> None:
+        """Export the journal to CSV using a payload dict with db_path and target_path.
+
+        Runs in the worker thread so a large export never stalls the event loop.
+        """
         try:
-            entries = storage.load_journal_entries(db_path)
-            self.entries_loaded.emit(entries)
+            db_path = payload.get("db_path") or DATABASE_PATH
+            target_path = Path(payload.get("target_path"))
+            exported_rows = storage.export_journal_to_csv(db_path, target_path)
         except Exception as exc:
-            logging.exception("DBWorker failed to reload after append")
+            logger.exception("DBWorker failed to export journal")
             try:
-                self.load_failed.emit(str(exc))
+                self.export_failed.emit(str(exc))
             except Exception:
                 pass
+            return
+
+        try:
+            self.export_succeeded.emit(exported_rows, target_path)
+        except Exception:
+            logger.exception("Failed to emit export_succeeded")
@@ -5,9 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JournalEntry:
-    """Represents a single journal entry with mood and structured feelings."""
+    """Represents a single journal entry with mood and structured feelings.
+
+    Slotted and immutable: rows are never edited after they are stored, and
+    dropping the per-instance ``__dict__`` keeps large histories compact.
+    """
 
     id: int
     timestamp: str
@@ -38,32 +42,56 @@ class EntryCache:
 
     def load_all(self, entries: list[JournalEntry]) -> None:
         """加载全量数据并更新缓存。通常在初始化或显式刷新时调用。"""
-        self._cache.clear()
-        self._sorted_ids.clear()
+        self._cache = {entry.id: entry for entry in entries}
+        # 按 (timestamp, id) DESC 排序（保持与数据库查询一致）；直接排序键元组，
+        # 比较在 C 层完成，不需要每次比较都回调 key 函数查字典
+        keyed = [(entry.timestamp, entry_id) for entry_id, entry in self._cache.items()]
+        keyed.sort(reverse=True)
+        self._sorted_ids = [entry_id for _, entry_id in keyed]
+
+    def _sort_key(self, entry_id: int) -> tuple[str, int]:
+        """返回缓存中某条记录的排序键 (timestamp, id)。"""
+        entry = self._cache[entry_id]
+        return (entry.timestamp, entry.id)
+
+    def add_entry(self, entry: JournalEntry) -> int:
+        """增量添加一条新记录到缓存，直接插入到排序位置而不整体重排。
+
+        返回插入位置，调用方可以在列表模型的同一行插入，保持两者顺序一致。
+        """
+        if entry.id in self._cache:
+            self._sorted_ids.remove(entry.id)
+        self._cache[entry.id] = entry
+
+        key = (entry.timestamp, entry.id)
+        sorted_ids = self._sorted_ids
+        # 新记录几乎总是最新的一条，直接放到开头
+        if not sorted_ids or key > self._sort_key(sorted_ids[0]):
+            sorted_ids.insert(0, entry.id)
+            return 0
+        # 少见情况（如系统时间被回拨）：插到第一条比它旧的记录之前，
+        # 列表插入本身就是 O(n)，顺序查找不会增加复杂度
+        for index, entry_id in enumerate(sorted_ids):
+            if self._sort_key(entry_id) < key:
+                sorted_ids.insert(index, entry.id)
+                return index
+        sorted_ids.append(entry.id)
+        return len(sorted_ids) - 1
+
+    def extend_older(self, entries: list[JournalEntry]) -> list[JournalEntry]:
+        """追加一页比现有记录更早的条目（分页加载），无需重新排序。
+
+        已在缓存中的条目会被跳过；返回实际追加的条目，调用方只把这些加入列表，
+        保持列表行与缓存顺序一致。
+        """
+        added: list[JournalEntry] = []
         for entry in entries:
+            if entry.id in self._cache:
+                continue
             self._cache[entry.id] = entry
-        # 按 timestamp DESC 排序（保持与数据库查询一致）
-        self._sorted_ids = sorted(
-            self._cache.keys(),
-            key=lambda entry_id: (
-                self._cache[entry_id].timestamp,
-                self._cache[entry_id].id,
-            ),
-            reverse=True,
-        )
-
-    def add_entry(self, entry: JournalEntry) -> None:
-        """增量添加一条新记录到缓存。"""
-        self._cache[entry.id] = entry
-        # 重新排序以保持顺序
-        self._sorted_ids = sorted(
-            self._cache.keys(),
-            key=lambda entry_id: (
-                self._cache[entry_id].timestamp,
-                self._cache[entry_id].id,
-            ),
-            reverse=True,
-        )
+            self._sorted_ids.append(entry.id)
+            added.append(entry)
+        return added
 
     def get_all_ordered(self) -> list[JournalEntry]:
         """返回按 timestamp DESC 排序的所有 entries。O(1) 操作，无 DB 查询。"""
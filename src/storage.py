@@ -2,31 +2,201 @@
 
 from __future__ import annotations
 
-import csv
-import json
+import atexit
 import logging
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from pathlib import Path
+from typing import BinaryIO
 
+try:  # optional: lets large legacy JSON files be migrated without loading them whole
+    import ijson
+except ImportError:
+    ijson = None
+
+try:  # optional: faster whole-file parsing when ijson is not available
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.constants import HISTORY_PAGE_SIZE
 from src.models import EntryCache, JournalEntry
 from src.utils import clamp_scale_value
 
+logger = logging.getLogger(__name__)
+
 
 def apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
     """Apply recommended PRAGMA tunings to an open SQLite connection.
 
     This centralizes the WAL and sync/temp_store settings so all code paths
-    opening the DB get consistent behavior.
+    opening the DB get consistent behavior. WAL lets the history reader run
+    while an archive write is in flight and requires SQLite >= 3.7.0.
+    ``journal_mode`` is persistent per database file, so only the writer sets
+    it; the rest are per-connection and applied by ``_configure_connection``.
     """
     try:
         conn.execute("PRAGMA journal_mode=WAL;")
+    except sqlite3.DatabaseError:
+        logger.exception("Failed to enable SQLite WAL journal mode.")
+    _configure_connection(conn)
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection PRAGMAs that do not persist in the file."""
+    try:
         conn.execute("PRAGMA synchronous=NORMAL;")
         conn.execute("PRAGMA temp_store=MEMORY;")
-        logging.info(
-            "Applied SQLite PRAGMAs: journal_mode=WAL, synchronous=NORMAL, temp_store=MEMORY"
+        conn.execute("PRAGMA mmap_size=268435456;")
+        conn.execute("PRAGMA cache_size=-8000;")
+        conn.execute("PRAGMA busy_timeout=5000;")
+        logger.info(
+            "Applied SQLite PRAGMAs: synchronous=NORMAL, temp_store=MEMORY, "
+            "mmap_size=256MiB, cache_size=8MiB, busy_timeout=5000"
         )
     except sqlite3.DatabaseError:
-        logging.exception("Failed to apply SQLite PRAGMA settings.")
+        logger.exception("Failed to apply SQLite PRAGMA settings.")
+
+
+# Bumped whenever initialize_storage gains a new migration step; stored in
+# PRAGMA user_version so up-to-date databases skip schema inspection.
+# Version 1: structured fields and REAL intensity/energy columns.
+# Version 2: legacy JSON import settled, so startup no longer looks for the file.
+SCHEMA_VERSION = 2
+
+
+def _scale_column_sql(column: str) -> str:
+    """SQL expression reproducing clamp_scale_value for one REAL column.
+
+    Non-numeric values (NULL, or TEXT that did not convert to REAL) fall back to
+    3.0. Python's round() rounds halves to even while SQLite's ROUND rounds
+    them away from zero, so exact halves are resolved explicitly.
+    """
+    doubled = f"(MIN(MAX({column}, 1.0), 5.0) * 2)"
+    return f"""CASE
+        WHEN typeof({column}) NOT IN ('integer', 'real') THEN 3.0
+        WHEN {doubled} - CAST({doubled} AS INTEGER) = 0.5
+            AND CAST({doubled} AS INTEGER) % 2 = 0
+            THEN CAST({doubled} AS INTEGER) / 2.0
+        ELSE ROUND({doubled}) / 2.0
+    END"""
+
+
+# SELECT list matching JournalEntry's field order. The str() coercion, NULL
+# defaults and clamp_scale_value normalisation of the old Python loop run
+# inside SQLite so rows arrive ready to unpack.
+_MOMENT_COLUMNS_SQL = f"""
+    id,
+    COALESCE(CAST(timestamp AS TEXT), ''),
+    COALESCE(CAST(mood AS TEXT), 'unspecified'),
+    COALESCE(CAST(text AS TEXT), ''),
+    COALESCE(CAST(body_sensation AS TEXT), ''),
+    COALESCE(CAST(trigger_event AS TEXT), ''),
+    COALESCE(CAST(need_boundary AS TEXT), ''),
+    {_scale_column_sql("emotion_intensity")},
+    {_scale_column_sql("energy_level")}
+"""
+
+# Full statements are module constants so every call passes the same text and
+# hits the connection's statement cache instead of re-formatting the SQL.
+_SELECT_ALL_MOMENTS_SQL = f"""
+    SELECT {_MOMENT_COLUMNS_SQL}
+    FROM moments
+    ORDER BY timestamp DESC, id DESC
+"""
+
+_SELECT_FIRST_PAGE_SQL = f"""
+    SELECT {_MOMENT_COLUMNS_SQL}
+    FROM moments
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+
+_SELECT_PAGE_BEFORE_SQL = f"""
+    SELECT {_MOMENT_COLUMNS_SQL}
+    FROM moments
+    WHERE (timestamp, id) < (?, ?)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+
+_SELECT_EXPORT_SQL = f"""
+    SELECT {_MOMENT_COLUMNS_SQL}
+    FROM moments
+    ORDER BY timestamp ASC, id ASC
+"""
+
+_INSERT_MOMENT_SQL = """
+    INSERT INTO moments (
+        timestamp,
+        mood,
+        text,
+        body_sensation,
+        trigger_event,
+        need_boundary,
+        emotion_intensity,
+        energy_level
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# One long-lived writer and one read-only reader per database file. Reusing
+# them avoids re-opening the main/-wal/-shm files and re-parsing the schema on
+# every archive click; the locks serialise access across the UI and worker
+# threads since both connections are shared.
+_writer_conns: dict[Path, sqlite3.Connection] = {}
+_reader_conns: dict[Path, sqlite3.Connection] = {}
+_writer_lock = threading.Lock()
+_reader_lock = threading.Lock()
+
+
+def _get_writer(db_path: Path) -> sqlite3.Connection:
+    """Return the cached writer connection for ``db_path``; hold ``_writer_lock``."""
+    key = db_path.resolve()
+    conn = _writer_conns.get(key)
+    if conn is None:
+        conn = sqlite3.connect(key, check_same_thread=False)
+        apply_sqlite_pragmas(conn)
+        _writer_conns[key] = conn
+    return conn
+
+
+def _get_reader(db_path: Path) -> sqlite3.Connection:
+    """Return the cached read-only connection for ``db_path``; hold ``_reader_lock``."""
+    key = db_path.resolve()
+    conn = _reader_conns.get(key)
+    if conn is None:
+        conn = sqlite3.connect(
+            f"{key.as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        # 只读连接不能也不必设置 journal_mode，WAL 已由写连接写入数据库文件
+        _configure_connection(conn)
+        _reader_conns[key] = conn
+    return conn
+
+
+def close_connections() -> None:
+    """Close cached connections, letting SQLite refresh planner stats first.
+
+    Readers are closed before writers: the last connection to close checkpoints
+    the WAL and removes the -wal/-shm files, which a read-only one cannot do.
+    """
+    with _reader_lock:
+        for conn in _reader_conns.values():
+            conn.close()
+        _reader_conns.clear()
+    with _writer_lock:
+        for conn in _writer_conns.values():
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.DatabaseError:
+                logger.exception("Failed to run PRAGMA optimize on shutdown.")
+            conn.close()
+        _writer_conns.clear()
+
+
+atexit.register(close_connections)
 
 
 def initialize_storage(db_path: Path, legacy_json_path: Path) -> None:
@@ -34,11 +204,9 @@ def initialize_storage(db_path: Path, legacy_json_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with sqlite3.connect(db_path) as conn:
-            # Apply centralized PRAGMA optimizations so schema creation and
-            # subsequent operations use WAL and tuned sync/temp_store settings.
-            apply_sqlite_pragmas(conn)
-
+        # Schema setup runs on the cached writer (PRAGMAs already applied), so
+        # the first archive reuses this connection instead of opening another.
+        with _writer_lock, _get_writer(db_path) as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS moments (
@@ -49,21 +217,41 @@ def initialize_storage(db_path: Path, legacy_json_path: Path) -> None:
                     body_sensation TEXT NOT NULL DEFAULT '',
                     trigger_event TEXT NOT NULL DEFAULT '',
                     need_boundary TEXT NOT NULL DEFAULT '',
-                    emotion_intensity INTEGER NOT NULL DEFAULT 3,
-                    energy_level INTEGER NOT NULL DEFAULT 3
+                    emotion_intensity REAL NOT NULL DEFAULT 3.0,
+                    energy_level REAL NOT NULL DEFAULT 3.0
                 )
                 """
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_moments_timestamp ON moments(timestamp)"
-            )
-            ensure_structured_fields(conn)
-            migrate_intensity_to_real(conn)
+            create_indexes(conn)
+            # 已迁移到当前 schema 的数据库跳过 table_info 检查和迁移
+            schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if schema_version < 1:
+                ensure_structured_fields(conn)
+                migrate_intensity_to_real(conn)
+                conn.execute("PRAGMA user_version = 1")
+            if schema_version < SCHEMA_VERSION and migrate_legacy_json(
+                legacy_json_path, conn
+            ):
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     except sqlite3.DatabaseError:
-        logging.exception("Failed to initialize journal database at %s", db_path)
+        logger.exception("Failed to initialize journal database at %s", db_path)
         raise
 
-    migrate_legacy_json(legacy_json_path, db_path)
+
+def create_indexes(conn: sqlite3.Connection) -> None:
+    """Create the moments indexes if they are missing.
+
+    ``idx_moments_ts_id_desc`` matches the history ``ORDER BY timestamp DESC,
+    id DESC`` exactly so SQLite can skip the sort step; the single-column
+    index stays for timestamp range filters.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_moments_timestamp ON moments(timestamp)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_moments_ts_id_desc "
+        "ON moments(timestamp DESC, id DESC)"
+    )
 
 
 def ensure_structured_fields(conn: sqlite3.Connection) -> None:
@@ -74,7 +262,7 @@ def ensure_structured_fields(conn: sqlite3.Connection) -> None:
             for column_info in conn.execute("PRAGMA table_info(moments)").fetchall()
         }
     except sqlite3.DatabaseError:
-        logging.exception("Failed to inspect journal database schema.")
+        logger.exception("Failed to inspect journal database schema.")
         raise
 
     column_specs = {
@@ -91,7 +279,7 @@ def ensure_structured_fields(conn: sqlite3.Connection) -> None:
         try:
             conn.execute(alter_sql)
         except sqlite3.DatabaseError:
-            logging.exception(
+            logger.exception(
                 "Failed to add column %s to journal database.", column_name
             )
             raise
@@ -148,88 +336,131 @@ def migrate_intensity_to_real(conn: sqlite3.Connection) -> None:
             conn.execute("ALTER TABLE moments_new RENAME TO moments")
 
             # 重建索引
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_moments_timestamp ON moments(timestamp)"
-            )
+            create_indexes(conn)
 
             conn.execute("COMMIT")
-            logging.info(
+            logger.info(
                 "Successfully migrated emotion_intensity and energy_level to REAL type"
             )
 
     except sqlite3.DatabaseError:
         conn.execute("ROLLBACK")
-        logging.exception("Failed to migrate intensity fields to REAL type")
+        logger.exception("Failed to migrate intensity fields to REAL type")
         raise
 
 
-def migrate_legacy_json(json_path: Path, db_path: Path) -> None:
-    """Import legacy JSON moments into SQLite, preserving the original file."""
-    if not json_path.exists() or json_path.stat().st_size == 0:
-        return
+LegacyRow = tuple[int, str, str, str, str, str, str, float, float]
+
 
+def _normalize_legacy_entry(entry: object) -> LegacyRow | None:
+    """Validate one legacy JSON moment and convert it to an insert row."""
+    if not isinstance(entry, dict):
+        return None
     try:
-        with json_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-    except (OSError, json.JSONDecodeError):
-        logging.exception("Failed to read legacy journal JSON from %s", json_path)
-        return
+        entry_id = int(entry.get("id", 0)) if entry.get("id") is not None else 0
+        timestamp = str(entry.get("timestamp", ""))
+        mood = str(entry.get("mood", "unspecified"))
+        text = str(entry.get("text", ""))
+        body_sensation = entry.get("body_sensation") or ""
+        trigger_event = entry.get("trigger_event") or ""
+        need_boundary = entry.get("need_boundary") or ""
+        if not isinstance(body_sensation, str):
+            body_sensation = str(body_sensation)
+        if not isinstance(trigger_event, str):
+            trigger_event = str(trigger_event)
+        if not isinstance(need_boundary, str):
+            need_boundary = str(need_boundary)
+        body_sensation = body_sensation.strip()[:30]
+        trigger_event = trigger_event.strip()[:30]
+        need_boundary = need_boundary.strip()[:30]
+        emotion_intensity = clamp_scale_value(entry.get("emotion_intensity"), 3.0)
+        energy_level = clamp_scale_value(entry.get("energy_level"), 3.0)
+    except (TypeError, ValueError):
+        logger.exception("Skipping invalid legacy entry during migration: %s", entry)
+        return None
+    return (
+        entry_id,
+        timestamp,
+        mood,
+        text,
+        body_sensation,
+        trigger_event,
+        need_boundary,
+        emotion_intensity,
+        energy_level,
+    )
 
-    raw_moments = data.get("moments", []) if isinstance(data, dict) else []
-    payload: list[tuple[int, str, str, str, str, str, str, float, float]] = []
-    for entry in raw_moments:
-        if not isinstance(entry, dict):
-            continue
-        try:
-            entry_id = int(entry.get("id", 0)) if entry.get("id") is not None else 0
-            timestamp = str(entry.get("timestamp", ""))
-            mood = str(entry.get("mood", "unspecified"))
-            text = str(entry.get("text", ""))
-            body_sensation = entry.get("body_sensation") or ""
-            trigger_event = entry.get("trigger_event") or ""
-            need_boundary = entry.get("need_boundary") or ""
-            if not isinstance(body_sensation, str):
-                body_sensation = str(body_sensation)
-            if not isinstance(trigger_event, str):
-                trigger_event = str(trigger_event)
-            if not isinstance(need_boundary, str):
-                need_boundary = str(need_boundary)
-            body_sensation = body_sensation.strip()[:30]
-            trigger_event = trigger_event.strip()[:30]
-            need_boundary = need_boundary.strip()[:30]
-            emotion_intensity = clamp_scale_value(entry.get("emotion_intensity"), 3.0)
-            energy_level = clamp_scale_value(entry.get("energy_level"), 3.0)
-        except (TypeError, ValueError):
-            logging.exception(
-                "Skipping invalid legacy entry during migration: %s", entry
-            )
-            continue
-        payload.append(
-            (
-                entry_id,
-                timestamp,
-                mood,
-                text,
-                body_sensation,
-                trigger_event,
-                need_boundary,
-                emotion_intensity,
-                energy_level,
-            )
-        )
 
-    if not payload:
+def _iter_legacy_moments(file: BinaryIO) -> Iterator[object]:
+    """Yield raw legacy moments, streaming them with ijson when it is installed.
+
+    Without ijson the file is parsed whole, with orjson if available and the
+    standard library otherwise.
+    """
+    if ijson is not None:
+        yield from ijson.items(file, "moments.item")
         return
 
+    if orjson is not None:
+        data = orjson.loads(file.read())
+    else:
+        import json
+
+        data = json.load(file)
+    if isinstance(data, dict):
+        yield from data.get("moments", [])
+
+
+def migrate_legacy_json(json_path: Path, conn: sqlite3.Connection) -> bool:
+    """Import legacy JSON moments into SQLite, preserving the original file.
+
+    Runs on the connection opened by ``initialize_storage`` so the schema is
+    not re-inspected, and inserts every row inside one ``BEGIN IMMEDIATE``
+    transaction so the whole import costs a single commit. Moments are
+    parsed lazily while ``executemany`` consumes them, so a database that
+    already has entries never parses the legacy file at all. The indexes are
+    dropped for the load and rebuilt once at the end, and ``synchronous`` is
+    relaxed for the block since the source JSON stays on disk.
+
+    Returns True once no legacy import can be needed any more (the import
+    succeeded or the database already has entries), letting the caller record
+    that and stop checking for the file. An empty database without a legacy
+    file returns False, so a journal.json copied in later is still imported.
+    """
+    # 一次 stat 同时判断存在与否和是否为空
     try:
-        with sqlite3.connect(db_path) as conn:
-            # ensure the connection benefits from performance tuning for writes
-            apply_sqlite_pragmas(conn)
+        legacy_size = json_path.stat().st_size
+    except OSError:
+        legacy_size = 0
+    if legacy_size == 0:
+        return conn.execute("SELECT EXISTS (SELECT 1 FROM moments)").fetchone()[0] == 1
+
+    # json 只在存在旧版文件时才需要，不放进启动路径
+    import json
+
+    legacy_json_errors: tuple[type[Exception], ...] = (json.JSONDecodeError,)
+    if ijson is not None:
+        legacy_json_errors += (ijson.JSONError,)
+
+    # synchronous 不能在事务内修改，所以在 BEGIN 之前关掉、结束后恢复
+    conn.execute("PRAGMA synchronous=OFF")
+    try:
+        with json_path.open("rb") as file:
+            conn.execute("BEGIN IMMEDIATE")
             existing = conn.execute("SELECT COUNT(*) FROM moments").fetchone()[0]
             if existing:
-                logging.info("Skipping legacy migration; database already has entries.")
-                return
-            conn.executemany(
+                conn.rollback()
+                logger.info("Skipping legacy migration; database already has entries.")
+                return True
+            # 空表批量导入：先删索引，写完后一次性重建，比逐行维护 B-tree 快
+            conn.execute("DROP INDEX IF EXISTS idx_moments_timestamp")
+            conn.execute("DROP INDEX IF EXISTS idx_moments_ts_id_desc")
+            rows = (
+                row
+                for row in map(_normalize_legacy_entry, _iter_legacy_moments(file))
+                if row is not None
+            )
+            cursor = conn.executemany(
                 """
                 INSERT OR IGNORE INTO moments (
                     id,
@@ -243,13 +474,30 @@ def migrate_legacy_json(json_path: Path, db_path: Path) -> None:
                     energy_level
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                payload,
-            )
-            logging.info(
-                "Migrated %d legacy journal entries into SQLite storage.", len(payload)
+                rows,
             )
+            create_indexes(conn)
+            # 批量导入后刷新统计信息，让查询规划器直接选中 (timestamp, id) 索引
+            conn.execute("ANALYZE moments")
+            conn.commit()
+    except (OSError, *legacy_json_errors):
+        if conn.in_transaction:
+            conn.rollback()
+        logger.exception("Failed to read legacy journal JSON from %s", json_path)
+        return False
     except sqlite3.DatabaseError:
-        logging.exception("Failed to migrate legacy JSON moments into SQLite.")
+        if conn.in_transaction:
+            conn.rollback()
+        logger.exception("Failed to migrate legacy JSON moments into SQLite.")
+        return False
+    finally:
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+    if cursor.rowcount > 0:
+        logger.info(
+            "Migrated %d legacy journal entries into SQLite storage.", cursor.rowcount
+        )
+    return True
 
 
 def append_entry_to_journal(
@@ -262,8 +510,8 @@ def append_entry_to_journal(
     emotion_intensity: float = 3.0,
     energy_level: float = 3.0,
     cache: EntryCache | None = None,
-) -> None:
-    """将新的 journal 条目持久化到 SQLite 数据库。
+) -> JournalEntry:
+    """将新的 journal 条目持久化到 SQLite 数据库，并返回带有最终 id 的条目。
 
     如果提供了缓存对象,会自动将新条目添加到缓存中,避免下次 refresh 时的 DB 查询。
 
@@ -277,12 +525,14 @@ def append_entry_to_journal(
         emotion_intensity: 情绪强度 (1.0-5.0, 支持0.5档位)
         energy_level: 能量水平 (1.0-5.0, 支持0.5档位)
         cache: 可选缓存对象,用于增量更新
+
+    Returns:
+        已写入的 JournalEntry，调用方可直接增量插入列表而无需重新查询
     """
     from datetime import datetime
 
     now = datetime.now().astimezone()
     timestamp = now.isoformat(timespec="seconds")
-    entry_id = int(now.timestamp() * 1000)
 
     body_sensation = ((body_sensation or "").strip())[:30]
     trigger_event = ((trigger_event or "").strip())[:30]
@@ -290,64 +540,73 @@ def append_entry_to_journal(
     intensity_value = clamp_scale_value(emotion_intensity)
     energy_value = clamp_scale_value(energy_level)
 
-    new_entry = JournalEntry(
-        id=entry_id,
-        timestamp=timestamp,
-        mood=mood,
-        text=text,
-        body_sensation=body_sensation,
-        trigger_event=trigger_event,
-        need_boundary=need_boundary,
-        emotion_intensity=intensity_value,
-        energy_level=energy_value,
-    )
+    new_entry = append_entries_to_journal(
+        [
+            JournalEntry(
+                id=0,
+                timestamp=timestamp,
+                mood=mood,
+                text=text,
+                body_sensation=body_sensation,
+                trigger_event=trigger_event,
+                need_boundary=need_boundary,
+                emotion_intensity=intensity_value,
+                energy_level=energy_value,
+            )
+        ],
+        db_path,
+    )[0]
+
+    # 成功写入，更新缓存
+    if cache is not None:
+        cache.add_entry(new_entry)
+
+    return new_entry
 
+
+def append_entries_to_journal(
+    entries: Iterable[JournalEntry], db_path: Path
+) -> list[JournalEntry]:
+    """在一个事务中批量写入多条记录，返回带有 SQLite 分配 id 的新条目。
+
+    传入条目的 id 会被忽略。所有行共用同一条已缓存的 INSERT 语句和一次提交，
+    批量导入时只付一次 fsync 的代价。
+
+    Args:
+        entries: 待写入的条目，字段应已规范化
+        db_path: 数据库路径
+
+    Returns:
+        按写入顺序排列、id 已更新的 JournalEntry 列表
+    """
+    inserted: list[JournalEntry] = []
     try:
-        with sqlite3.connect(db_path) as conn:
-            # apply PRAGMA optimizations for journal writes
-            apply_sqlite_pragmas(conn)
-            for attempt in range(3):
-                try:
-                    conn.execute(
-                        """
-                        INSERT INTO moments (
-                            id,
-                            timestamp,
-                            mood,
-                            text,
-                            body_sensation,
-                            trigger_event,
-                            need_boundary,
-                            emotion_intensity,
-                            energy_level
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            new_entry.id,
-                            new_entry.timestamp,
-                            new_entry.mood,
-                            new_entry.text,
-                            new_entry.body_sensation,
-                            new_entry.trigger_event,
-                            new_entry.need_boundary,
-                            new_entry.emotion_intensity,
-                            new_entry.energy_level,
-                        ),
-                    )
-                except sqlite3.IntegrityError:
-                    new_entry.id += 1
-                    continue
-
-                # 成功写入，更新缓存
-                if cache is not None:
-                    cache.add_entry(new_entry)
-                return
-
-            raise sqlite3.IntegrityError("Failed to generate unique journal entry ID")
+        with _writer_lock, _get_writer(db_path) as conn:
+            # 显式 BEGIN IMMEDIATE：一开始就拿到写锁，避免隐式事务在 INSERT
+            # 时才升级锁而撞上 busy 重试；提交由 with conn 负责
+            conn.execute("BEGIN IMMEDIATE")
+            for entry in entries:
+                # id 是 rowid 别名，由 SQLite 分配，不会出现冲突重试
+                cursor = conn.execute(
+                    _INSERT_MOMENT_SQL,
+                    (
+                        entry.timestamp,
+                        entry.mood,
+                        entry.text,
+                        entry.body_sensation,
+                        entry.trigger_event,
+                        entry.need_boundary,
+                        entry.emotion_intensity,
+                        entry.energy_level,
+                    ),
+                )
+                inserted.append(replace(entry, id=int(cursor.lastrowid or 0)))
     except sqlite3.DatabaseError:
-        logging.exception("Failed to append journal entry to database.")
+        logger.exception("Failed to append journal entries to database.")
         raise
 
+    return inserted
+
 
 def load_journal_entries(
     db_path: Path, cache: EntryCache | None = None
@@ -371,57 +630,15 @@ def load_journal_entries(
         return []
 
     try:
-        with sqlite3.connect(db_path) as conn:
-            # ensure readers use the same connection-level PRAGMA where helpful
-            apply_sqlite_pragmas(conn)
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT
-                    id,
-                    timestamp,
-                    mood,
-                    text,
-                    body_sensation,
-                    trigger_event,
-                    need_boundary,
-                    emotion_intensity,
-                    energy_level
-                FROM moments
-                ORDER BY timestamp DESC, id DESC
-                """
-            ).fetchall()
+        with _reader_lock:
+            conn = _get_reader(db_path)
+            rows = conn.execute(_SELECT_ALL_MOMENTS_SQL).fetchall()
     except sqlite3.DatabaseError:
-        logging.exception("Failed to load journal entries from SQLite.")
-        return []
-
-    if not rows:
+        logger.exception("Failed to load journal entries from SQLite.")
         return []
 
-    entries: list[JournalEntry] = []
-    for row in rows:
-        row_dict = dict(row)
-        try:
-            entries.append(
-                JournalEntry(
-                    id=int(row_dict.get("id", 0))
-                    if row_dict.get("id") is not None
-                    else 0,
-                    timestamp=str(row_dict.get("timestamp", "")),
-                    mood=str(row_dict.get("mood", "unspecified")),
-                    text=str(row_dict.get("text", "")),
-                    body_sensation=str(row_dict.get("body_sensation", "")),
-                    trigger_event=str(row_dict.get("trigger_event", "")),
-                    need_boundary=str(row_dict.get("need_boundary", "")),
-                    emotion_intensity=clamp_scale_value(
-                        row_dict.get("emotion_intensity")
-                    ),
-                    energy_level=clamp_scale_value(row_dict.get("energy_level")),
-                )
-            )
-        except (TypeError, ValueError):
-            logging.exception("Skipping malformed database row: %s", row_dict)
-            continue
+    # 列顺序与 JournalEntry 字段一致，默认值和范围限制已在 SQL 中完成
+    entries = [JournalEntry(*row) for row in rows]
 
     # 更新缓存
     if cache is not None:
@@ -430,6 +647,42 @@ def load_journal_entries(
     return entries
 
 
+def load_journal_page(
+    db_path: Path,
+    before: tuple[str, int] | None = None,
+    limit: int = HISTORY_PAGE_SIZE,
+) -> list[JournalEntry]:
+    """按 (timestamp, id) 键集分页加载一页条目。
+
+    Args:
+        db_path: 数据库文件路径
+        before: 上一页最后一条的 (timestamp, id)；None 表示从最新的一条开始
+        limit: 每页最多返回的条目数
+
+    Returns:
+        按 timestamp DESC, id DESC 排序、严格早于 before 的最多 limit 条记录
+    """
+    if not db_path.exists():
+        return []
+
+    if before is None:
+        sql = _SELECT_FIRST_PAGE_SQL
+        params: tuple[object, ...] = (limit,)
+    else:
+        sql = _SELECT_PAGE_BEFORE_SQL
+        params = (before[0], before[1], limit)
+
+    try:
+        with _reader_lock:
+            conn = _get_reader(db_path)
+            rows = conn.execute(sql, params).fetchall()
+    except sqlite3.DatabaseError:
+        logger.exception("Failed to load journal page from SQLite.")
+        return []
+
+    return [JournalEntry(*row) for row in rows]
+
+
 def export_journal_to_csv(db_path: Path, csv_path: Path) -> int:
     """Write journal entries to a CSV file and return the number of rows exported.
 
@@ -442,40 +695,39 @@ def export_journal_to_csv(db_path: Path, csv_path: Path) -> int:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with sqlite3.connect(db_path) as conn:
-            apply_sqlite_pragmas(conn)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT
-                    id,
-                    timestamp,
-                    mood,
-                    text,
-                    body_sensation,
-                    trigger_event,
-                    need_boundary,
-                    emotion_intensity,
-                    energy_level
-                FROM moments
-                ORDER BY timestamp ASC, id ASC
-                """
-            )
+        with _reader_lock:
+            conn = _get_reader(db_path)
+            # 纯元组行，列顺序与 CSV 表头一致，可直接交给 csv.writer
+            cursor = conn.execute(_SELECT_EXPORT_SQL)
             return _write_entries_to_csv(cursor, csv_path)
     except sqlite3.DatabaseError:
-        logging.exception("Failed to export journal entries from SQLite.")
+        logger.exception("Failed to export journal entries from SQLite.")
         raise
     except OSError:
-        logging.exception("Failed to write journal CSV export to %s", csv_path)
+        logger.exception("Failed to write journal CSV export to %s", csv_path)
         raise
 
 
+_CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+
 def _write_entries_to_csv(cursor: sqlite3.Cursor, csv_path: Path) -> int:
-    """Write database cursor rows to CSV file using streaming approach."""
+    """Stream cursor tuples into a CSV file without materialising the rows."""
+    # csv 只有导出时才用到，延迟导入以缩短启动时间
+    import csv
+
     row_count = 0
-    batch_size = 1000
 
-    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+    def _counted_rows() -> Iterator[tuple]:
+        nonlocal row_count
+        for row in cursor:
+            row_count += 1
+            yield row
+
+    # 1 MiB 缓冲区：按块落盘而不是每行一次 write()
+    with csv_path.open(
+        "w", encoding="utf-8", newline="", buffering=_CSV_WRITE_BUFFER_SIZE
+    ) as handle:
         writer = csv.writer(handle)
         writer.writerow(
             [
@@ -490,26 +742,6 @@ def _write_entries_to_csv(cursor: sqlite3.Cursor, csv_path: Path) -> int:
                 "energy_level",
             ]
         )
-
-        while True:
-            rows = cursor.fetchmany(batch_size)
-            if not rows:
-                break
-
-            for row in rows:
-                writer.writerow(
-                    [
-                        row["id"],
-                        row["timestamp"],
-                        row["mood"],
-                        row["text"],
-                        row["body_sensation"],
-                        row["trigger_event"],
-                        row["need_boundary"],
-                        row["emotion_intensity"],
-                        row["energy_level"],
-                    ]
-                )
-                row_count += 1
+        writer.writerows(_counted_rows())
 
     return row_count
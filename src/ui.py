@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from PySide6.QtCore import (
     QAbstractListModel,
+    QDateTime,
+    QEvent,
+    QMimeData,
     QModelIndex,
     QPersistentModelIndex,
     Qt,
@@ -17,7 +20,15 @@ from PySide6.QtCore import (
     Signal,
     Slot,
 )
-from PySide6.QtGui import QCloseEvent, QColor, QFont, QPalette
+from PySide6.QtGui import (
+    QCloseEvent,
+    QColor,
+    QFont,
+    QKeyEvent,
+    QPalette,
+    QTextCursor,
+    QTextDocument,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -45,12 +56,13 @@ from src.constants import (
     DATABASE_PATH,
     ENTRY_CHARACTER_LIMIT,
     GENTLE_REMINDER_INTERVAL_MS,
+    HISTORY_PAGE_SIZE,
     MOOD_CHOICES,
     MOOD_DISPLAY_LOOKUP,
 )
 from src.db_worker import DBWorker
 from src.models import EntryCache, JournalEntry
-from src.storage import export_journal_to_csv
+from src.storage import close_connections
 from src.utils import (
     clamp_scale_value,
     format_timestamp_display,
@@ -58,10 +70,37 @@ from src.utils import (
     render_entry_detail_html,
 )
 
+logger = logging.getLogger(__name__)
+
 BODY_SENSATION_PRESETS = ["胸口紧绷", "肩膀发冷", "手心潮湿"]
 TRIGGER_PRESETS = ["会议讨论", "手机通知", "临时改期"]
 NEED_PRESETS = ["需要短暂休息", "想说明界限", "渴望被陪伴"]
 
+# 历史列表中正文预览的最大字符数，以及压缩空白前截取的前缀长度
+_PREVIEW_LENGTH = 48
+_PREVIEW_SCAN_LENGTH = _PREVIEW_LENGTH * 4
+
+# 历史列表行里结构化字段和正文预览的前缀
+_STRUCTURED_PREFIX = "  ~ "
+_PREVIEW_PREFIX = "  -> "
+
+# data() 每次绘制都会按多个角色被调用，枚举成员提前取出避免重复属性查找
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# 详情面板文档缓存的最大条数
+_DETAIL_CACHE_SIZE = 256
+
+# 会影响 is_dark_theme() 结果的窗口事件
+_THEME_CHANGE_EVENTS = frozenset(
+    {
+        QEvent.Type.PaletteChange,
+        QEvent.Type.ApplicationPaletteChange,
+        QEvent.Type.StyleChange,
+        QEvent.Type.ThemeChange,
+    }
+)
+
 
 class JournalEntryListModel(QAbstractListModel):
     """自定义 List Model 用于虚拟化日志条目列表。
@@ -73,6 +112,7 @@ class JournalEntryListModel(QAbstractListModel):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._entries: list[JournalEntry] = []
+        self._display_cache: dict[int, str] = {}
 
     def rowCount(
         self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
@@ -88,47 +128,58 @@ class JournalEntryListModel(QAbstractListModel):
         role: int = Qt.ItemDataRole.DisplayRole,
     ) -> Any:
         """返回指定索引和角色的数据。"""
+        # 视图会为字体、图标、尺寸等角色反复调用 data()，先按角色快速返回
+        if role != _DISPLAY_ROLE and role != _USER_ROLE:
+            return None
         if not index.isValid() or index.row() >= len(self._entries):
             return None
 
         entry = self._entries[index.row()]
 
-        if role == Qt.ItemDataRole.DisplayRole:
-            # 生成显示文本
-            preview = " ".join(entry.text.strip().split())
-            if len(preview) > 48:
-                preview = preview[:47] + "…"
+        if role == _DISPLAY_ROLE:
+            # 条目不可变，显示文本按 id 缓存，滚动回来时无需重新格式化
+            display_text = self._display_cache.get(entry.id)
+            if display_text is None:
+                display_text = self._format_display_text(entry)
+                self._display_cache[entry.id] = display_text
+            return display_text
 
-            timestamp_display = format_timestamp_display(entry.timestamp)
-            mood_display = MOOD_DISPLAY_LOOKUP.get(entry.mood, entry.mood)
+        # UserRole：存储完整的 entry 对象供详情显示使用
+        return entry
 
-            display_lines = [f"[{timestamp_display}] {mood_display}"]
-            display_lines.append(
-                f"  * 强度 Intensity {entry.emotion_intensity}/5 | 能量 Energy {entry.energy_level}/5"
-            )
+    @staticmethod
+    def _format_display_text(entry: JournalEntry) -> str:
+        """生成列表中一条记录的多行显示文本。"""
+        # 预览只用前 48 个字符：先压缩一段足够长的前缀，长文本不必整段 split；
+        # 前缀压缩后仍不够长时（大量空白）才退回整段处理
+        text = entry.text
+        head = text[:_PREVIEW_SCAN_LENGTH]
+        preview = " ".join(head.split())
+        if len(preview) <= _PREVIEW_LENGTH and len(head) < len(text):
+            preview = " ".join(text.split())
+        if len(preview) > _PREVIEW_LENGTH:
+            preview = preview[: _PREVIEW_LENGTH - 1] + "…"
+
+        timestamp_display = format_timestamp_display(entry.timestamp)
+        mood_display = MOOD_DISPLAY_LOOKUP.get(entry.mood, entry.mood)
+
+        display_lines = [
+            f"[{timestamp_display}] {mood_display}",
+            f"  * 强度 Intensity {entry.emotion_intensity}/5 | 能量 Energy {entry.energy_level}/5",
+        ]
 
+        body_sensation = entry.body_sensation.strip()
+        trigger_event = entry.trigger_event.strip()
+        need_boundary = entry.need_boundary.strip()
+        if body_sensation or trigger_event or need_boundary:
             structured_preview = " | ".join(
-                part
-                for part in (
-                    entry.body_sensation.strip(),
-                    entry.trigger_event.strip(),
-                    entry.need_boundary.strip(),
-                )
-                if part
+                part for part in (body_sensation, trigger_event, need_boundary) if part
             )
+            display_lines.append(_STRUCTURED_PREFIX + structured_preview)
+        if preview:
+            display_lines.append(_PREVIEW_PREFIX + preview)
 
-            if structured_preview:
-                display_lines.append(f"  ~ {structured_preview}")
-            if preview:
-                display_lines.append(f"  -> {preview}")
-
-            return "\n".join(display_lines)
-
-        elif role == Qt.ItemDataRole.UserRole:
-            # 存储完整的 entry 对象供详情显示使用
-            return entry
-
-        return None
+        return "\n".join(display_lines)
 
     def get_entry(self, index: QModelIndex) -> JournalEntry | None:
         """获取指定索引的 JournalEntry 对象。"""
@@ -140,21 +191,82 @@ class JournalEntryListModel(QAbstractListModel):
         """设置新的条目列表并通知视图更新。"""
         self.beginResetModel()
         self._entries = entries
+        self._display_cache.clear()
         self.endResetModel()
 
+    def insert_entry(self, row: int, entry: JournalEntry) -> None:
+        """在指定行插入一条新记录，只通知视图新增一行而不重置模型。"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.insert(row, entry)
+        self.endInsertRows()
+
+    def append_entries(self, entries: list[JournalEntry]) -> None:
+        """在列表末尾追加一页较早的记录，只通知视图新增的行。"""
+        if not entries:
+            return
+        start = len(self._entries)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
     def clear(self) -> None:
         """清空所有条目。"""
         self.beginResetModel()
         self._entries = []
+        self._display_cache.clear()
         self.endResetModel()
 
 
+class LimitedTextEdit(QTextEdit):
+    """在输入阶段就拒绝超出字数上限的 QTextEdit。
+
+    打字和粘贴在写入文档之前检查剩余字数，避免先插入再整段截断重建文档；
+    输入法提交等其他路径仍由 MemoWindow.on_text_changed 兜底截断。
+    """
+
+    def __init__(self, max_length: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._max_length = max_length
+
+    def _remaining_length(self) -> int:
+        """返回还能插入的字符数，选中的文字会被替换，因此计入可用空间。"""
+        # 统一按 Python 字符（码点）计数，与计数器和 archive_entry 的截断一致；
+        # 文档位置和 characterCount() 按 UTF-16 计数，emoji 会被算成两个字符。
+        # 输入框最多只有上限长度的文字，复制一份纯文本的开销可以忽略
+        used = len(self.toPlainText())
+        selected = len(self.textCursor().selectedText())
+        return self._max_length - used + selected
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        typed = event.text()
+        if (
+            typed
+            and (typed.isprintable() or typed in "\r\t")
+            and self._remaining_length() < len(typed)
+        ):
+            event.accept()
+            return
+        super().keyPressEvent(event)
+
+    def insertFromMimeData(self, source: QMimeData) -> None:
+        if not source.hasText():
+            super().insertFromMimeData(source)
+            return
+        remaining = self._remaining_length()
+        text = source.text()
+        if len(text) <= remaining:
+            super().insertFromMimeData(source)
+        elif remaining > 0:
+            self.textCursor().insertText(text[:remaining])
+
+
 class MemoWindow(QWidget):
     """Main application window for the memo pad and journal review."""
 
     # Request signals (emit from UI thread, handled by DBWorker in worker thread)
     append_request = Signal(object)  # payload dict
     load_request = Signal(object)  # optional payload (unused)
+    export_request = Signal(object)  # payload dict
 
     def __init__(self) -> None:
         super().__init__()
@@ -163,11 +275,36 @@ class MemoWindow(QWidget):
         self.setObjectName("MemoWindow")
         self._initial_palette: QPalette | None = None
         self._accent_color: QColor | None = None
+        # is_dark_theme() 的缓存结果；调色板或系统主题变化时置空，下次使用时重算
+        self._dark_theme: bool | None = None
         self._apply_fluent_theme()
 
         self._pending_entry_preview: str = ""
+        # 导出对话框的默认目录，只解析一次
+        self._export_dir = Path.home()
+        # 复用的提示框：图标和按钮只构建一次，之后只替换标题和文字
+        self._info_box = QMessageBox(
+            QMessageBox.Icon.Information, "", "", QMessageBox.StandardButton.Ok, self
+        )
+        self._error_box = QMessageBox(
+            QMessageBox.Icon.Critical, "", "", QMessageBox.StandardButton.Ok, self
+        )
 
         self._entry_cache = EntryCache()
+        # 已解析好的详情文档，按 (entry.id, 是否深色主题) 缓存；条目写入后不可变，
+        # 命中时直接 setDocument，跳过 HTML 解析。按 LRU 限制条数，
+        # 避免翻遍整个历史后缓存无限增长
+        self._detail_cache: OrderedDict[tuple[int, bool], QTextDocument] = OrderedDict()
+        # 详情面板当前显示内容对应的缓存键，空状态时为 None
+        self._last_detail_key: tuple[int, bool] | None = None
+        # 空状态使用独立文档，避免 setHtml 改写正在显示的缓存文档
+        self._empty_document: QTextDocument | None = None
+        # 历史列表分页状态：是否可能还有更早的记录、是否有一页正在加载
+        self._has_more_history = True
+        self._history_page_loading = False
+        # 已从数据库加载的最旧一条的 (timestamp, id)，作为下一页的 keyset 游标；
+        # 只随数据库分页更新，新写入的条目不会改变它
+        self._last_key: tuple[str, int] | None = None
 
         layout = QVBoxLayout()
         layout.setContentsMargins(28, 28, 28, 24)
@@ -268,13 +405,14 @@ class MemoWindow(QWidget):
             layout.addLayout(row)
             self._add_preset_chip_row(layout, chip_label, presets, line_edit)
 
-        self.text_edit = QTextEdit()
+        self.text_edit = LimitedTextEdit(ENTRY_CHARACTER_LIMIT)
         self.text_edit.textChanged.connect(self.on_text_changed)
         # 优化滚动流畅性
         if hasattr(self.text_edit.verticalScrollBar(), "setSingleStep"):
             self.text_edit.verticalScrollBar().setSingleStep(14)
         layout.addWidget(self.text_edit)
 
+        self._last_text_length = 0
         self.counter = QLabel(f"0 / {ENTRY_CHARACTER_LIMIT}")
         self.counter.setAlignment(Qt.AlignmentFlag.AlignRight)
         layout.addWidget(self.counter)
@@ -315,12 +453,20 @@ class MemoWindow(QWidget):
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
         self.history_list.setUniformItemSizes(False)  # 保持 False 因为条目高度不统一
+        # 行高不统一时，重置模型会同步测量每一行；分批布局让首屏先出来，
+        # 其余行在事件循环空闲时逐批计算
+        self.history_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.history_list.setBatchSize(HISTORY_PAGE_SIZE)
         # 启用平滑滚动
         if hasattr(self.history_list.verticalScrollBar(), "setSingleStep"):
             self.history_list.verticalScrollBar().setSingleStep(12)
         self.history_list.selectionModel().currentChanged.connect(
             self.on_history_selection_changed
         )
+        # 滚动接近底部时加载下一页
+        self.history_list.verticalScrollBar().valueChanged.connect(
+            self._maybe_load_next_page
+        )
         self.history_splitter.addWidget(self.history_list)
 
         self.history_detail_widget = QWidget()
@@ -391,6 +537,8 @@ class MemoWindow(QWidget):
         self.tray_icon.activated.connect(self.on_tray_icon_activated)
 
         self.reminder_timer = QTimer(self)
+        # 10 分钟的提醒不需要精确计时，粗粒度定时器允许系统合并唤醒以省电
+        self.reminder_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
         self.reminder_timer.setInterval(GENTLE_REMINDER_INTERVAL_MS)
         self.reminder_timer.timeout.connect(self.show_gentle_reminder)
         self.reminder_timer.setSingleShot(False)
@@ -403,12 +551,16 @@ class MemoWindow(QWidget):
         # connect UI requests to worker slots (queued connection ensures thread crossing)
         self.append_request.connect(self._db_worker.append_entry)
         self.load_request.connect(self._db_worker.load_entries)
+        self.export_request.connect(self._db_worker.export_entries)
 
         # connect worker responses back to UI slots
         self._db_worker.entries_loaded.connect(self._on_entries_loaded)
+        self._db_worker.page_loaded.connect(self._on_page_loaded)
         self._db_worker.append_failed.connect(self._on_append_failed)
         self._db_worker.load_failed.connect(self._on_load_failed)
         self._db_worker.append_succeeded.connect(self._on_append_succeeded)
+        self._db_worker.export_succeeded.connect(self._on_export_succeeded)
+        self._db_worker.export_failed.connect(self._on_export_failed)
 
         self._db_thread.start()
 
@@ -756,21 +908,28 @@ class MemoWindow(QWidget):
         self.update()
 
     def on_text_changed(self) -> None:
-        """Handle text input changes and enforce character limit."""
+        """Update the character counter, trimming input that slipped past the limit."""
+        # 按 Python 字符（码点）计数；输入框最多只有上限长度的文字，复制开销可以忽略
         text = self.text_edit.toPlainText()
-        if len(text) > ENTRY_CHARACTER_LIMIT:
-            cursor = self.text_edit.textCursor()
-            position = cursor.position()
-
+        length = len(text)
+        if length > ENTRY_CHARACTER_LIMIT:
+            # 用光标删掉超出部分，而不是 setPlainText 整段重建文档；
+            # 用户光标的位置由 Qt 随删除自动调整。文档位置按 UTF-16 计数，
+            # 需要先把第 ENTRY_CHARACTER_LIMIT 个字符换算成文档位置
+            keep = text[:ENTRY_CHARACTER_LIMIT]
+            cursor = QTextCursor(self.text_edit.document())
+            cursor.setPosition(len(keep.encode("utf-16-le")) // 2)
+            cursor.movePosition(
+                QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor
+            )
             self.text_edit.blockSignals(True)
-            self.text_edit.setPlainText(text[:ENTRY_CHARACTER_LIMIT])
+            cursor.removeSelectedText()
             self.text_edit.blockSignals(False)
+            length = ENTRY_CHARACTER_LIMIT
 
-            cursor.setPosition(min(position, ENTRY_CHARACTER_LIMIT))
-            self.text_edit.setTextCursor(cursor)
-            text = self.text_edit.toPlainText()
-
-        self.counter.setText(f"{len(text)} / {ENTRY_CHARACTER_LIMIT}")
+        if length != self._last_text_length:
+            self._last_text_length = length
+            self.counter.setText(f"{length} / {ENTRY_CHARACTER_LIMIT}")
 
     def on_intensity_value_changed(self, value: int) -> None:
         """Update intensity value label when slider changes."""
@@ -820,7 +979,7 @@ class MemoWindow(QWidget):
         # 将滑块值(2-10)转换为实际值(1.0-5.0)
         intensity_value = self.intensity_slider.value() / 2.0
         energy_value = self.energy_slider.value() / 2.0
-        # send append request to DB worker; it will reload entries and emit them
+        # send append request to DB worker; it will emit the inserted entry back
         payload = {
             "text": text,
             "mood": mood,
@@ -856,7 +1015,7 @@ class MemoWindow(QWidget):
             if not icon_was_visible:
                 QTimer.singleShot(2600, self.tray_icon.hide)
         else:
-            logging.info(notification_body)
+            logger.info(notification_body)
 
     def minimize_to_tray(self) -> None:
         """Minimize the window to system tray."""
@@ -896,7 +1055,8 @@ class MemoWindow(QWidget):
                 self._db_thread.quit()
                 self._db_thread.wait(2000)
         except Exception:
-            logging.exception("Failed to stop DB worker thread cleanly")
+            logger.exception("Failed to stop DB worker thread cleanly")
+        close_connections()
 
         app = QApplication.instance()
         if app is not None:
@@ -928,41 +1088,44 @@ class MemoWindow(QWidget):
                 2000,
             )
 
+    def _show_message(self, box: QMessageBox, title: str, text: str) -> None:
+        """Show a reusable message box; if it is already open, just update its text."""
+        box.setWindowTitle(title)
+        box.setText(text)
+        if not box.isVisible():
+            box.exec()
+
+    def changeEvent(self, event: QEvent) -> None:
+        if event.type() in _THEME_CHANGE_EVENTS:
+            # 子控件的调色板此时可能尚未更新，只标记失效，等下次使用时再重算
+            self._dark_theme = None
+        super().changeEvent(event)
+
     def is_dark_theme(self) -> bool:
         """Check the current palette to decide whether to render dark-mode art."""
-        palette = self.history_content.palette()
-        base_lightness = palette.color(QPalette.ColorRole.Base).lightnessF()
-        window_lightness = palette.color(QPalette.ColorRole.Window).lightnessF()
-        return min(base_lightness, window_lightness) < 0.5
+        if self._dark_theme is None:
+            palette = self.history_content.palette()
+            base_lightness = palette.color(QPalette.ColorRole.Base).lightnessF()
+            window_lightness = palette.color(QPalette.ColorRole.Window).lightnessF()
+            self._dark_theme = min(base_lightness, window_lightness) < 0.5
+        return self._dark_theme
 
     def refresh_history(self) -> None:
-        """Refresh the history list.
+        """Reload the history list from its newest page.
 
-        On the first call it loads entries from the database and caches them;subsequent calls use the cached data to avoid DB queries.
-        When new entries are added, the cache is updated incrementally so refresh_history becomes an O(1) operation.
+        The load runs on the DB worker; _on_entries_loaded then replaces the
+        cache and the list. New entries reach both incrementally, so this is
+        only needed at startup.
         """
         # request background load; UI will be updated by _on_entries_loaded
         self.load_request.emit(None)
 
-    # ---- background worker callbacks ----
-    @Slot(object)
-    def _on_entries_loaded(self, entries) -> None:
-        """Receive entries from worker, update cache and list in UI thread."""
-        # update cache safely in UI thread
-        try:
-            if entries:
-                self._entry_cache.load_all(entries)
-        except Exception:
-            logging.exception("Failed to update entry cache with loaded entries")
-
+    def _populate_history(self, entries: list[JournalEntry]) -> None:
+        """Show the given entries in the history list and select the newest one."""
         # 使用 Model 更新列表，实现虚拟化渲染
         if not entries:
             self.history_list_model.clear()
-            self.history_content.setHtml(
-                render_empty_history_html(self.is_dark_theme())
-            )
-            self.intensity_bar.setValue(0)
-            self.energy_bar.setValue(0)
+            self._show_empty_history()
             return
 
         self.history_list_model.set_entries(entries)
@@ -972,21 +1135,80 @@ class MemoWindow(QWidget):
             first_index = self.history_list_model.index(0, 0)
             self.history_list.setCurrentIndex(first_index)
 
+    # ---- background worker callbacks ----
+    @Slot(object)
+    def _on_entries_loaded(self, entries) -> None:
+        """Receive entries from worker, update cache and list in UI thread."""
+        # update cache safely in UI thread
+        try:
+            self._entry_cache.load_all(entries)
+        except Exception:
+            logger.exception("Failed to update entry cache with loaded entries")
+
+        self._has_more_history = len(entries) >= HISTORY_PAGE_SIZE
+        self._last_key = (entries[-1].timestamp, entries[-1].id) if entries else None
+        self._populate_history(entries)
+
+    def _maybe_load_next_page(self, *_: object) -> None:
+        """Request the next older page once the list is scrolled near its end."""
+        if self._history_page_loading or not self._has_more_history:
+            return
+
+        scroll_bar = self.history_list.verticalScrollBar()
+        if scroll_bar.value() < scroll_bar.maximum() - scroll_bar.pageStep():
+            return
+
+        if self._last_key is None:
+            return
+
+        self._history_page_loading = True
+        self.load_request.emit({"before": self._last_key})
+
+    @Slot(object)
+    def _on_page_loaded(self, entries) -> None:
+        """Append an older page from the worker to the cache and the list."""
+        self._history_page_loading = False
+        self._has_more_history = len(entries) >= HISTORY_PAGE_SIZE
+        if entries:
+            self._last_key = (entries[-1].timestamp, entries[-1].id)
+        # 与已显示记录重叠的条目不再追加，避免列表出现重复行
+        self.history_list_model.append_entries(self._entry_cache.extend_older(entries))
+
     @Slot(str)
     def _on_append_failed(self, message: str) -> None:
-        logging.error("Append failed: %s", message)
-        QMessageBox.critical(self, "Archive Failed", f"Could not save entry: {message}")
+        logger.error("Append failed: %s", message)
+        self._show_message(
+            self._error_box, "Archive Failed", f"Could not save entry: {message}"
+        )
         self.save_button.setEnabled(True)
 
     @Slot(str)
     def _on_load_failed(self, message: str) -> None:
-        logging.error("Load failed: %s", message)
-        QMessageBox.critical(self, "Load Failed", f"Could not load entries: {message}")
+        logger.error("Load failed: %s", message)
+        self._history_page_loading = False
+        self._show_message(
+            self._error_box, "Load Failed", f"Could not load entries: {message}"
+        )
 
-    @Slot()
-    def _on_append_succeeded(self) -> None:
+    @Slot(object)
+    def _on_append_succeeded(self, entry: JournalEntry) -> None:
         # re-enable save button and clear inputs on successful append
         self.save_button.setEnabled(True)
+
+        # 增量插入新条目，避免整表重新查询和模型重置；插入位置由缓存决定，
+        # 系统时间被回拨时新条目不一定在最上面。比已加载窗口还旧、且后面还有
+        # 未加载的页时不插入，留给覆盖它的那一页带回来，以免列表跳过中间的记录
+        if (
+            self._has_more_history
+            and self._last_key is not None
+            and (entry.timestamp, entry.id) < self._last_key
+        ):
+            logger.info("Archived entry %s is older than the loaded history", entry.id)
+        else:
+            row = self._entry_cache.add_entry(entry)
+            self.history_list_model.insert_entry(row, entry)
+            self.history_list.setCurrentIndex(self.history_list_model.index(row, 0))
+
         self.notify_entry_archived()
 
         delay_minutes = int(self.reminder_selector.currentData() or 0)
@@ -1003,7 +1225,7 @@ class MemoWindow(QWidget):
             def _fire_future_reminder(message: str = reminder_text) -> None:
                 """Emit a gentle tray reminder referencing the saved snippet."""
                 if not QSystemTrayIcon.isSystemTrayAvailable():
-                    logging.info("Future reminder: %s", message)
+                    logger.info("Future reminder: %s", message)
                     return
 
                 icon_was_visible = self.tray_icon.isVisible()
@@ -1032,30 +1254,58 @@ class MemoWindow(QWidget):
         self.intensity_slider.setValue(3)
         self.energy_slider.setValue(3)
 
+    def _new_detail_document(self, html: str) -> QTextDocument:
+        """Parse HTML into a standalone document styled like the detail view."""
+        # setDocument 不会套用控件字体（含样式表设置的字号），需要手动指定
+        self.history_content.ensurePolished()
+        document = QTextDocument()
+        document.setDefaultFont(self.history_content.font())
+        document.setHtml(html)
+        return document
+
+    def _show_empty_history(self) -> None:
+        """Show the empty-state message in the detail pane and clear the meters."""
+        self._last_detail_key = None
+        document = self._new_detail_document(
+            render_empty_history_html(self.is_dark_theme())
+        )
+        # 先挂上新文档再释放旧文档，避免视图引用已销毁的对象
+        self.history_content.setDocument(document)
+        self._empty_document = document
+        self.intensity_bar.setValue(0)
+        self.energy_bar.setValue(0)
+
     def on_history_selection_changed(
         self, current: QModelIndex, previous: QModelIndex
     ) -> None:
         """Handle selection changes in history list."""
         if not current.isValid():
-            self.history_content.setHtml(
-                render_empty_history_html(self.is_dark_theme())
-            )
-            self.intensity_bar.setValue(0)
-            self.energy_bar.setValue(0)
+            self._show_empty_history()
             return
 
         entry = self.history_list_model.get_entry(current)
         if entry is None:
-            self.history_content.setHtml(
-                render_empty_history_html(self.is_dark_theme())
-            )
-            self.intensity_bar.setValue(0)
-            self.energy_bar.setValue(0)
+            self._show_empty_history()
             return
 
-        self.history_content.setHtml(
-            render_entry_detail_html(entry, self.is_dark_theme())
-        )
+        dark_mode = self.is_dark_theme()
+        detail_key = (entry.id, dark_mode)
+        # 同一条记录被重复选中（或选区绕回）时，面板内容不变，直接跳过
+        if detail_key == self._last_detail_key:
+            return
+        self._last_detail_key = detail_key
+        document = self._detail_cache.get(detail_key)
+        if document is None:
+            document = self._new_detail_document(
+                render_entry_detail_html(entry, dark_mode)
+            )
+            self._detail_cache[detail_key] = document
+        else:
+            self._detail_cache.move_to_end(detail_key)
+        self.history_content.setDocument(document)
+        # 淘汰放在 setDocument 之后：被淘汰的是最久未用的文档，不会是正在显示的
+        if len(self._detail_cache) > _DETAIL_CACHE_SIZE:
+            self._detail_cache.popitem(last=False)
         # 将浮点值(1.0-5.0)转换为进度条值(2-10)
         intensity_bar_value = int(clamp_scale_value(entry.emotion_intensity) * 2)
         energy_bar_value = int(clamp_scale_value(entry.energy_level) * 2)
@@ -1066,10 +1316,8 @@ class MemoWindow(QWidget):
 
     def export_journal(self) -> None:
         """Export journal entries to a CSV file."""
-        suggested_name = (
-            f"journal-export-{datetime.now().strftime('%Y%m%d-%H%M%S')}.csv"
-        )
-        default_path = str(Path.home() / suggested_name)
+        timestamp = QDateTime.currentDateTime().toString("yyyyMMdd-HHmmss")
+        default_path = str(self._export_dir / f"journal-export-{timestamp}.csv")
 
         target_path_str, _ = QFileDialog.getSaveFileName(
             self,
@@ -1081,26 +1329,29 @@ class MemoWindow(QWidget):
         if not target_path_str:
             return
 
-        target_path = Path(target_path_str)
-
-        try:
-            exported_rows = export_journal_to_csv(DATABASE_PATH, target_path)
-        except Exception as exc:  # surfacing rare export failures
-            logging.exception("Journal export failed")
-            QMessageBox.critical(
-                self, "Export Failed", f"Could not export journal: {exc}"
-            )
-            return
+        # export runs on the DB worker thread; results arrive via _on_export_*
+        self.export_button.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.CursorShape.BusyCursor)
+        self.export_request.emit(
+            {"db_path": DATABASE_PATH, "target_path": Path(target_path_str)}
+        )
 
+    @Slot(int, object)
+    def _on_export_succeeded(self, exported_rows: int, target_path: Path) -> None:
+        QApplication.restoreOverrideCursor()
+        self.export_button.setEnabled(True)
+        resolved_path = target_path.resolve()
         if exported_rows == 0:
-            QMessageBox.information(
-                self,
-                "Export Complete",
-                f"Exported an empty journal to {target_path.resolve()}",
-            )
+            message = f"Exported an empty journal to {resolved_path}"
         else:
-            QMessageBox.information(
-                self,
-                "Export Complete",
-                f"Exported {exported_rows} entries to {target_path.resolve()}",
-            )
+            message = f"Exported {exported_rows} entries to {resolved_path}"
+        self._show_message(self._info_box, "Export Complete", message)
+
+    @Slot(str)
+    def _on_export_failed(self, message: str) -> None:
+        logger.error("Export failed: %s", message)
+        QApplication.restoreOverrideCursor()
+        self.export_button.setEnabled(True)
+        self._show_message(
+            self._error_box, "Export Failed", f"Could not export journal: {message}"
+        )
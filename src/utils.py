@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import html
+import re
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
 from src.constants import (
     EMPTY_HISTORY_TEMPLATE,
     ENTRY_DETAIL_TEMPLATE,
+    ENTRY_FIELD_ITEM_TEMPLATE,
+    ENTRY_FIELDS_TEMPLATE,
     MOOD_DISPLAY_LOOKUP,
 )
 from src.models import JournalEntry
 
+# "YYYY-MM-DDTHH:MM" 或 "YYYY-MM-DD HH:MM" 开头的时间戳可以直接切片显示
+_ISO_MINUTE_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+
 
 def clamp_scale_value(raw: object, default: float = 3.0) -> float:
     """Convert raw slider-like values to the canonical 1.0-5.0 scale (with 0.5 increments)."""
@@ -28,6 +38,10 @@ def format_timestamp_display(timestamp: str) -> str:
     """Render ISO timestamps into a compact, reader-friendly string."""
     if not timestamp:
         return "未知时间"
+    # 存储的时间戳几乎都是 ISO 格式，前 16 个字符就是要显示的本地时间，
+    # 直接切片即可，省去 fromisoformat + strftime
+    if _ISO_MINUTE_PREFIX.match(timestamp):
+        return f"{timestamp[:10]} {timestamp[11:16]}"
     try:
         dt = datetime.fromisoformat(timestamp)
     except ValueError:
@@ -35,27 +49,54 @@ def format_timestamp_display(timestamp: str) -> str:
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
-def review_theme_colors(dark_mode: bool) -> dict[str, str]:
-    """Choose review pane colors based on the current palette."""
+@lru_cache(maxsize=2)
+def review_theme_colors(dark_mode: bool) -> Mapping[str, str]:
+    """Choose review pane colors based on the current palette (cached, read-only)."""
     if dark_mode:
-        return {
-            "text": "#dfe6e9",
-            "secondary": "#a4b0be",
-            "divider": "#3a3f44",
-            "art": "#c8ced3",
+        return MappingProxyType(
+            {
+                "text": "#dfe6e9",
+                "secondary": "#a4b0be",
+                "divider": "#3a3f44",
+                "art": "#c8ced3",
+            }
+        )
+    return MappingProxyType(
+        {
+            "text": "#2d3436",
+            "secondary": "#636e72",
+            "divider": "#dfe6e9",
+            "art": "#7f8c8d",
         }
-    return {
-        "text": "#2d3436",
-        "secondary": "#636e72",
-        "divider": "#dfe6e9",
-        "art": "#7f8c8d",
-    }
+    )
 
 
-def render_entry_detail_html(entry: JournalEntry, dark_mode: bool = False) -> str:
-    """Render the selected journal entry via the Jinja2 template."""
+class _KeepMissingPlaceholders(dict):
+    """format_map helper that leaves unknown ``{name}`` placeholders in place."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+@lru_cache(maxsize=2)
+def _themed_detail_templates(dark_mode: bool) -> tuple[str, str]:
+    """Return the detail and field-list templates with theme colors baked in."""
     colors = review_theme_colors(dark_mode)
-    structured_fields: list[dict[str, str]] = []
+    theme = _KeepMissingPlaceholders(
+        text_color=colors["text"],
+        secondary_color=colors["secondary"],
+        divider_color=colors["divider"],
+    )
+    return (
+        ENTRY_DETAIL_TEMPLATE.format_map(theme),
+        ENTRY_FIELDS_TEMPLATE.format_map(theme),
+    )
+
+
+def render_entry_detail_html(entry: JournalEntry, dark_mode: bool = False) -> str:
+    """Render the selected journal entry into the review-pane HTML template."""
+    # 两套主题的样式外壳已预先填好，这里只替换每条记录自己的字段
+    detail_template, fields_template = _themed_detail_templates(dark_mode)
 
     intensity_value = clamp_scale_value(entry.emotion_intensity)
     energy_value = clamp_scale_value(entry.energy_level)
@@ -66,25 +107,31 @@ def render_entry_detail_html(entry: JournalEntry, dark_mode: bool = False) -> st
         ("需求/界限 Need or Boundary", entry.need_boundary),
     )
 
-    for label, raw_value in field_specs:
-        trimmed = (raw_value or "").strip()
-        if trimmed:
-            structured_fields.append({"label": label, "value": trimmed})
-
-    return ENTRY_DETAIL_TEMPLATE.render(
-        colors=colors,
-        timestamp_display=format_timestamp_display(entry.timestamp),
-        mood_display=MOOD_DISPLAY_LOOKUP.get(entry.mood, entry.mood),
+    # 模板只做纯字符串替换，用户输入的字段都要在这里转义
+    items = [
+        ENTRY_FIELD_ITEM_TEMPLATE.format(label=label, value=html.escape(trimmed))
+        for label, raw_value in field_specs
+        if (trimmed := (raw_value or "").strip())
+    ]
+    structured_fields = fields_template.format(items="\n".join(items)) if items else ""
+
+    if entry.text.strip():
+        body_html = html.escape(entry.text).replace("\n", "<br>")
+    else:
+        body_html = "<em>（此刻的记录为空）</em>"
+
+    return detail_template.format(
+        timestamp_display=html.escape(format_timestamp_display(entry.timestamp)),
+        mood_display=html.escape(MOOD_DISPLAY_LOOKUP.get(entry.mood, entry.mood)),
         emotion_intensity=intensity_value,
         energy_level=energy_value,
         structured_fields=structured_fields,
-        body_text=entry.text,
-        has_body=bool(entry.text.strip()),
-        empty_body_notice="（此刻的记录为空）",
+        body_html=body_html,
     )
 
 
+@lru_cache(maxsize=2)
 def render_empty_history_html(dark_mode: bool) -> str:
-    """Render a friendly empty-state message that respects theme colors."""
+    """Render a friendly empty-state message that respects theme colors (cached per theme)."""
     colors = review_theme_colors(dark_mode)
-    return EMPTY_HISTORY_TEMPLATE.render(colors=colors)
+    return EMPTY_HISTORY_TEMPLATE.format(secondary_color=colors["secondary"])
@@ -6,9 +6,11 @@ from pathlib import Path
 
 from ..src.models import EntryCache, JournalEntry
 from ..src.storage import (
+    append_entries_to_journal,
     append_entry_to_journal,
     initialize_storage,
     load_journal_entries,
+    load_journal_page,
 )
 
 
@@ -72,6 +74,53 @@ def test_entry_cache_add():
     print("✓ Cache incremental-add test passed")
 
 
+def test_entry_cache_add_out_of_order():
+    """Test entries added out of timestamp order still land in DESC position"""
+    cache = EntryCache()
+    cache.load_all(
+        [
+            JournalEntry(id=1, timestamp="2025-01-01T10:00:00", mood="calm", text="a"),
+            JournalEntry(id=3, timestamp="2025-01-01T12:00:00", mood="calm", text="c"),
+        ]
+    )
+
+    # 返回值是插入位置，供列表模型在同一行插入
+    assert (
+        cache.add_entry(
+            JournalEntry(id=2, timestamp="2025-01-01T11:00:00", mood="calm", text="b")
+        )
+        == 1
+    )
+    assert (
+        cache.add_entry(
+            JournalEntry(id=0, timestamp="2025-01-01T09:00:00", mood="calm", text="z")
+        )
+        == 3
+    )
+    # 重复添加同一 id 时替换原记录而不是出现两次
+    cache.add_entry(
+        JournalEntry(id=1, timestamp="2025-01-01T13:00:00", mood="calm", text="a2")
+    )
+
+    assert [entry.id for entry in cache.get_all_ordered()] == [1, 3, 2, 0]
+    assert cache.get_by_id(1).text == "a2"
+
+    print("✓ Cache out-of-order add test passed")
+
+
+def test_entry_cache_extend_older_skips_known_ids():
+    """Test extend_older returns only the entries it actually appended"""
+    cache = EntryCache()
+    newer = JournalEntry(id=2, timestamp="2025-01-01T11:00:00", mood="calm", text="b")
+    older = JournalEntry(id=1, timestamp="2025-01-01T10:00:00", mood="calm", text="a")
+    cache.load_all([newer])
+
+    assert cache.extend_older([newer, older]) == [older]
+    assert [entry.id for entry in cache.get_all_ordered()] == [2, 1]
+
+    print("✓ Cache extend_older overlap test passed")
+
+
 def test_entry_cache_invalidation():
     """Test cache invalidation"""
     cache = EntryCache()
@@ -159,11 +208,167 @@ def test_cache_with_incremental_update():
         shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+def test_load_journal_page_keyset():
+    """Test keyset pagination returns consecutive, non-overlapping pages"""
+    import shutil
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        db_path = Path(tmpdir) / "test.db"
+        initialize_storage(db_path, Path(tmpdir) / "legacy.json")
+
+        for i in range(5):
+            append_entry_to_journal(text=f"Entry {i + 1}", mood="calm", db_path=db_path)
+
+        first_page = load_journal_page(db_path, limit=2)
+        assert [entry.text for entry in first_page] == ["Entry 5", "Entry 4"]
+
+        last = first_page[-1]
+        second_page = load_journal_page(
+            db_path, before=(last.timestamp, last.id), limit=2
+        )
+        assert [entry.text for entry in second_page] == ["Entry 3", "Entry 2"]
+
+        last = second_page[-1]
+        final_page = load_journal_page(
+            db_path, before=(last.timestamp, last.id), limit=2
+        )
+        assert [entry.text for entry in final_page] == ["Entry 1"]
+
+        print("✓ Keyset pagination test passed")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def test_append_entries_bulk():
+    """Test bulk append assigns fresh ids and persists every entry"""
+    import shutil
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        db_path = Path(tmpdir) / "test.db"
+        initialize_storage(db_path, Path(tmpdir) / "legacy.json")
+
+        inserted = append_entries_to_journal(
+            [
+                JournalEntry(
+                    id=0, timestamp=f"2025-01-01T1{i}:00:00", mood="calm", text=f"{i}"
+                )
+                for i in range(3)
+            ],
+            db_path,
+        )
+        assert len({entry.id for entry in inserted}) == 3
+
+        loaded = load_journal_entries(db_path)
+        assert [entry.id for entry in loaded] == [entry.id for entry in inserted][::-1]
+
+        print("✓ Bulk append test passed")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def test_legacy_migration_sentinel():
+    """Test legacy JSON is imported once and later startups skip the file"""
+    import json
+    import shutil
+    import sqlite3
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        db_path = Path(tmpdir) / "test.db"
+        legacy_path = Path(tmpdir) / "legacy.json"
+
+        # 空库且没有旧文件：不记录哨兵，之后放入的旧文件仍会被导入
+        initialize_storage(db_path, legacy_path)
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+
+        legacy_path.write_text(
+            json.dumps(
+                {
+                    "moments": [
+                        {
+                            "id": 7,
+                            "timestamp": "2025-01-01T10:00:00",
+                            "mood": "calm",
+                            "text": "legacy",
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+        initialize_storage(db_path, legacy_path)
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+        assert [entry.text for entry in load_journal_entries(db_path)] == ["legacy"]
+
+        # 哨兵已记录：即使旧文件损坏也不会再被读取
+        legacy_path.write_text("{not json", encoding="utf-8")
+        initialize_storage(db_path, legacy_path)
+        assert len(load_journal_entries(db_path)) == 1
+
+        print("✓ Legacy migration sentinel test passed")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def test_load_normalises_like_clamp_scale_value():
+    """Test the SQL-side clamp matches clamp_scale_value, including .25/.75 halves"""
+    import shutil
+    import sqlite3
+
+    from ..src.utils import clamp_scale_value
+
+    raw_values = [
+        0.25, 1.25, 1.75, 2.25, 2.75, 3.25, 3.75, 4.25, 4.75,
+        0, 7, 3, 2.6, -1.0, 9.9, "high", "",
+    ]  # fmt: skip
+    tmpdir = tempfile.mkdtemp()
+    try:
+        db_path = Path(tmpdir) / "test.db"
+        initialize_storage(db_path, Path(tmpdir) / "missing.json")
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                "INSERT INTO moments (id, timestamp, mood, text, emotion_intensity,"
+                " energy_level) VALUES (?, ?, 'calm', 'x', ?, ?)",
+                [
+                    (index + 1, f"2025-01-01T10:{index:02d}:00", raw, raw)
+                    for index, raw in enumerate(raw_values)
+                ],
+            )
+            # BLOB 时间戳不受 TEXT 亲和性转换，读出时也必须是字符串
+            conn.execute(
+                "INSERT INTO moments (id, timestamp, mood, text) "
+                "VALUES (100, CAST('20250101' AS BLOB), 'calm', 'blob timestamp')"
+            )
+
+        entries = {entry.id: entry for entry in load_journal_entries(db_path)}
+        for index, raw in enumerate(raw_values):
+            entry = entries[index + 1]
+            expected = clamp_scale_value(raw)
+            assert entry.emotion_intensity == expected, (raw, entry.emotion_intensity)
+            assert entry.energy_level == expected, (raw, entry.energy_level)
+        assert entries[100].timestamp == "20250101"
+        assert entries[100].emotion_intensity == 3.0
+
+        print("✓ SQL clamp parity test passed")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
 if __name__ == "__main__":
     print("Running cache unit tests...\n")
     test_entry_cache_basic()
     test_entry_cache_add()
+    test_entry_cache_add_out_of_order()
+    test_entry_cache_extend_older_skips_known_ids()
     test_entry_cache_invalidation()
     test_load_with_cache()
     test_cache_with_incremental_update()
+    test_load_journal_page_keyset()
+    test_append_entries_bulk()
+    test_legacy_migration_sentinel()
+    test_load_normalises_like_clamp_scale_value()
     print("\n✅ All tests passed! Cache optimization features are working correctly.")
@@ -0,0 +1,55 @@
+"""Tests for the background DBWorker slots."""
+
+from __future__ import annotations
+
+import csv
+
+from ..src.db_worker import DBWorker
+from ..src.storage import append_entry_to_journal, initialize_storage
+
+
+def _recording_worker() -> tuple[DBWorker, list[tuple], list[str]]:
+    """创建 worker 并记录导出信号；直接调用槽函数时信号同步送达。"""
+    worker = DBWorker()
+    succeeded: list[tuple] = []
+    failed: list[str] = []
+    worker.export_succeeded.connect(lambda rows, path: succeeded.append((rows, path)))
+    worker.export_failed.connect(failed.append)
+    return worker, succeeded, failed
+
+
+def test_export_entries_emits_row_count_and_path(tmp_path):
+    """测试导出成功时发出行数和目标路径，并写出完整的 CSV。"""
+    db_path = tmp_path / "journal.sqlite3"
+    initialize_storage(db_path, tmp_path / "missing.json")
+    append_entry_to_journal("first", "calm", db_path)
+    append_entry_to_journal("second", "joyful", db_path)
+
+    worker, succeeded, failed = _recording_worker()
+    target_path = tmp_path / "exports" / "journal.csv"
+    worker.export_entries({"db_path": db_path, "target_path": str(target_path)})
+
+    assert failed == []
+    assert succeeded == [(2, target_path)]
+    with target_path.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0][0] == "id"
+    assert [row[3] for row in rows[1:]] == ["first", "second"]
+
+
+def test_export_entries_emits_failure_for_unwritable_target(tmp_path):
+    """测试目标路径无法写入时发出 export_failed，而不是 export_succeeded。"""
+    db_path = tmp_path / "journal.sqlite3"
+    initialize_storage(db_path, tmp_path / "missing.json")
+    append_entry_to_journal("entry", "calm", db_path)
+
+    # 父路径是一个普通文件，无法在其下创建导出文件
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+
+    worker, succeeded, failed = _recording_worker()
+    worker.export_entries({"db_path": db_path, "target_path": blocker / "journal.csv"})
+
+    assert succeeded == []
+    assert len(failed) == 1
+    assert failed[0]
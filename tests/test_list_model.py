@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from PySide6.QtCore import QModelIndex, Qt
 
-from ..src.models import JournalEntry
+from ..src.models import EntryCache, JournalEntry
 from ..src.ui import JournalEntryListModel
 
 
@@ -122,6 +122,55 @@ class TestJournalEntryListModel:
         assert model.get_entry(QModelIndex()) is None
         assert model.get_entry(model.index(999, 0)) is None
 
+    def test_insert_entry_at_top(self):
+        """测试插入到第 0 行的条目出现在顶部。"""
+        model = JournalEntryListModel()
+        model.set_entries(
+            [
+                JournalEntry(
+                    id=1, timestamp="2025-11-11 10:00:00", mood="calm", text="Old"
+                )
+            ]
+        )
+
+        model.insert_entry(
+            0,
+            JournalEntry(
+                id=2, timestamp="2025-11-11 11:00:00", mood="happy", text="New"
+            ),
+        )
+
+        assert model.rowCount() == 2
+        first = model.get_entry(model.index(0, 0))
+        assert first is not None
+        assert first.id == 2
+        second = model.get_entry(model.index(1, 0))
+        assert second is not None
+        assert second.id == 1
+
+    def test_insert_entry_follows_cache_order(self):
+        """测试按缓存给出的位置插入，时间戳较旧的新条目不会被放到顶部。"""
+        entries = [
+            JournalEntry(id=3, timestamp="2025-11-11 12:00:00", mood="calm", text="C"),
+            JournalEntry(id=1, timestamp="2025-11-11 10:00:00", mood="calm", text="A"),
+        ]
+        cache = EntryCache()
+        cache.load_all(entries)
+        model = JournalEntryListModel()
+        model.set_entries(cache.get_all_ordered())
+
+        # 系统时间被回拨后写入的记录
+        entry = JournalEntry(
+            id=4, timestamp="2025-11-11 11:00:00", mood="calm", text="B"
+        )
+        model.insert_entry(cache.add_entry(entry), entry)
+
+        model_ids = [
+            model.get_entry(model.index(row, 0)).id for row in range(model.rowCount())
+        ]
+        assert model_ids == [3, 4, 1]
+        assert model_ids == [item.id for item in cache.get_all_ordered()]
+
     def test_clear(self):
         """测试清空模型。"""
         model = JournalEntryListModel()
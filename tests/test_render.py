@@ -0,0 +1,31 @@
+"""Tests for the review-pane HTML renderers."""
+
+from __future__ import annotations
+
+from ..src.models import JournalEntry
+from ..src.utils import render_empty_history_html, render_entry_detail_html
+
+
+def test_entry_detail_escapes_user_text():
+    """测试用户输入在详情 HTML 中被转义，换行转换为 <br>。"""
+    entry = JournalEntry(
+        id=1,
+        timestamp="2025-11-11T10:00:00",
+        mood="calm",
+        text="<b>hi</b>\nsecond line",
+        body_sensation="<script>",
+    )
+    html = render_entry_detail_html(entry)
+    assert "&lt;b&gt;hi&lt;/b&gt;<br>second line" in html
+    assert "&lt;script&gt;" in html
+    assert "<script>" not in html
+    assert "2025-11-11 10:00" in html
+
+
+def test_entry_detail_empty_body_and_fields():
+    """测试空正文显示占位文字，且没有结构化字段时不渲染列表。"""
+    entry = JournalEntry(id=1, timestamp="", mood="calm", text="   ")
+    html = render_entry_detail_html(entry, dark_mode=True)
+    assert "（此刻的记录为空）" in html
+    assert "<ul" not in html
+    assert "还没有记录" in render_empty_history_html(True)
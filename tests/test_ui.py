@@ -0,0 +1,298 @@
+"""Widget tests for the entry editor and the review pane."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QMimeData, QModelIndex  # noqa: E402
+from PySide6.QtGui import QColor, QPalette, QTextCursor  # noqa: E402
+from PySide6.QtTest import QTest  # noqa: E402
+from PySide6.QtWidgets import QApplication, QFileDialog  # noqa: E402
+
+from ..src.constants import (  # noqa: E402
+    DATABASE_PATH,
+    ENTRY_CHARACTER_LIMIT,
+    HISTORY_PAGE_SIZE,
+    LEGACY_JSON_PATH,
+)
+from ..src.models import JournalEntry  # noqa: E402
+from ..src.storage import (  # noqa: E402
+    append_entries_to_journal,
+    append_entry_to_journal,
+    initialize_storage,
+)
+from ..src.ui import LimitedTextEdit, MemoWindow  # noqa: E402
+
+EMOJI = "\U0001f600"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """共享一个 QApplication 实例。"""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    """在临时目录中创建主窗口（DATABASE_PATH 是相对路径），结束时停掉后台线程。"""
+    monkeypatch.chdir(tmp_path)
+    memo = MemoWindow()
+    yield memo
+    memo.quit_application()
+
+
+def _wait_until(condition, timeout_ms: int = 5000) -> bool:
+    """处理事件直到条件成立，用于等待后台线程经排队信号送回的结果。"""
+    for _ in range(timeout_ms // 10):
+        if condition():
+            return True
+        QTest.qWait(10)
+    return condition()
+
+
+def _run_export(window, monkeypatch, target_path) -> list[tuple[str, str]]:
+    """通过导出按钮的流程导出到 target_path，返回弹出的提示框标题和文字。"""
+    messages: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        window, "_show_message", lambda box, title, text: messages.append((title, text))
+    )
+    monkeypatch.setattr(
+        QFileDialog, "getSaveFileName", lambda *args, **kwargs: (str(target_path), "")
+    )
+
+    window.export_journal()
+    # 导出在后台线程进行：按钮先被禁用并显示忙碌光标
+    assert not window.export_button.isEnabled()
+    assert QApplication.overrideCursor() is not None
+
+    assert _wait_until(window.export_button.isEnabled)
+    assert QApplication.overrideCursor() is None
+    return messages
+
+
+def _show_rows(window, count: int) -> list[QModelIndex]:
+    """在历史列表中放入 count 条记录，返回各行的索引。"""
+    window.history_list_model.set_entries(
+        [
+            JournalEntry(
+                id=entry_id,
+                timestamp=f"2025-01-01T10:{entry_id:02d}:00",
+                mood="calm",
+                text=f"entry {entry_id}",
+            )
+            for entry_id in range(count, 0, -1)
+        ]
+    )
+    model = window.history_list_model
+    return [model.index(row, 0) for row in range(count)]
+
+
+def _select(window, index: QModelIndex) -> None:
+    window.on_history_selection_changed(index, QModelIndex())
+
+
+def _paste(edit: LimitedTextEdit, text: str) -> None:
+    mime = QMimeData()
+    mime.setText(text)
+    edit.insertFromMimeData(mime)
+
+
+def test_limited_text_edit_counts_code_points(qapp):
+    """测试字数上限按字符计算，emoji 等非 BMP 字符不会被算成两个。"""
+    edit = LimitedTextEdit(10)
+
+    _paste(edit, EMOJI * 6)
+    assert edit.toPlainText() == EMOJI * 6
+
+    # 还剩 4 个字符，多出的输入被拒绝
+    QTest.keyClicks(edit, "abcdef")
+    assert edit.toPlainText() == EMOJI * 6 + "abcd"
+
+    # 选中的文字会被替换，因此计入可用空间
+    edit.selectAll()
+    _paste(edit, EMOJI * 15)
+    assert edit.toPlainText() == EMOJI * 10
+
+
+def test_text_changed_trims_by_characters(window):
+    """测试兜底截断和计数器按字符计算，绕过输入检查的 emoji 不会被截掉一半。"""
+    document = window.text_edit.document()
+
+    # 直接写入文档，模拟绕过 LimitedTextEdit 输入检查的路径（如输入法提交）
+    limit = ENTRY_CHARACTER_LIMIT
+    QTextCursor(document).insertText(EMOJI * (limit - 1))
+    assert window.counter.text() == f"{limit - 1} / {limit}"
+
+    cursor = QTextCursor(document)
+    cursor.movePosition(QTextCursor.MoveOperation.End)
+    cursor.insertText("ab" + EMOJI)
+    assert window.text_edit.toPlainText() == EMOJI * (limit - 1) + "a"
+    assert window.counter.text() == f"{limit} / {limit}"
+
+
+def test_export_reports_row_count_and_restores_cursor(window, monkeypatch, tmp_path):
+    """测试导出成功后恢复光标和按钮，并提示导出的条数。"""
+    initialize_storage(DATABASE_PATH, LEGACY_JSON_PATH)
+    append_entry_to_journal("first", "calm", DATABASE_PATH)
+    append_entry_to_journal("second", "calm", DATABASE_PATH)
+    target_path = tmp_path / "export.csv"
+
+    messages = _run_export(window, monkeypatch, target_path)
+
+    assert messages == [
+        ("Export Complete", f"Exported 2 entries to {target_path.resolve()}")
+    ]
+    assert target_path.exists()
+
+
+def test_export_failure_restores_cursor(window, monkeypatch, tmp_path):
+    """测试导出失败时同样恢复光标和按钮，并弹出错误提示。"""
+    initialize_storage(DATABASE_PATH, LEGACY_JSON_PATH)
+    append_entry_to_journal("entry", "calm", DATABASE_PATH)
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+
+    messages = _run_export(window, monkeypatch, blocker / "export.csv")
+
+    assert len(messages) == 1
+    assert messages[0][0] == "Export Failed"
+
+
+def test_detail_document_reused_on_reselect(window):
+    """测试重新选中同一条记录时复用已解析的详情文档。"""
+    first, second = _show_rows(window, 2)
+
+    _select(window, first)
+    first_document = window.history_content.document()
+    assert "entry 2" in first_document.toPlainText()
+
+    _select(window, second)
+    assert window.history_content.document() is not first_document
+
+    _select(window, first)
+    assert window.history_content.document() is first_document
+
+
+def test_detail_cache_eviction_keeps_shown_document(window, monkeypatch):
+    """测试超过缓存上限时只淘汰最久未用的文档，正在显示的文档始终保留。"""
+    ui_module = sys.modules[MemoWindow.__module__]
+    # 上限为 1 时，每次切换都会淘汰上一份仍挂在面板上的文档
+    monkeypatch.setattr(ui_module, "_DETAIL_CACHE_SIZE", 1)
+    rows = _show_rows(window, 4)
+
+    for index in rows:
+        _select(window, index)
+        shown = window.history_content.document()
+        assert len(window._detail_cache) == 1
+        assert shown in window._detail_cache.values()
+        assert window.history_list_model.get_entry(index).text in shown.toPlainText()
+
+    # 最早选中的记录已被淘汰，再次选中时重新渲染并正常显示
+    _select(window, rows[0])
+    assert "entry 4" in window.history_content.document().toPlainText()
+    assert len(window._detail_cache) == 1
+
+
+def test_detail_cache_key_follows_theme(window):
+    """测试主题切换后缓存键随之变化，不会复用另一主题的文档。"""
+    (index,) = _show_rows(window, 1)
+    _select(window, index)
+    first_key = window._last_detail_key
+    first_document = window.history_content.document()
+
+    # 切换到与当前相反的主题（离屏平台的默认调色板可能本身就是深色）
+    palette = QPalette(window.palette())
+    color = QColor("#f5f5f5" if first_key[1] else "#202020")
+    for role in (QPalette.ColorRole.Base, QPalette.ColorRole.Window):
+        palette.setColor(role, color)
+    # 主题判断读取详情面板的调色板（它的颜色受窗口样式表控制，不会从窗口继承）；
+    # 窗口的 setPalette 触发 PaletteChange，changeEvent 会清掉缓存的主题判断
+    window.history_content.setPalette(palette)
+    window.setPalette(palette)
+    assert window._dark_theme is None
+
+    _select(window, index)
+    assert window._last_detail_key == (first_key[0], not first_key[1])
+    assert window.history_content.document() is not first_document
+
+
+def _history_ids(window) -> list[int]:
+    model = window.history_list_model
+    return [model.get_entry(model.index(row, 0)).id for row in range(model.rowCount())]
+
+
+def test_paging_ignores_archived_entry_older_than_loaded_window(
+    qapp, tmp_path, monkeypatch
+):
+    """测试写入比已加载窗口更旧的条目后，分页游标不变，剩余记录仍能加载出来。"""
+    monkeypatch.chdir(tmp_path)
+    total = HISTORY_PAGE_SIZE * 2 + 50
+    initialize_storage(DATABASE_PATH, LEGACY_JSON_PATH)
+    append_entries_to_journal(
+        [
+            JournalEntry(
+                id=0,
+                timestamp=f"2025-03-01T{minute // 60:02d}:{minute % 60:02d}:00",
+                mood="calm",
+                text=f"entry {minute}",
+            )
+            for minute in range(total)
+        ],
+        DATABASE_PATH,
+    )
+
+    window = MemoWindow()
+    try:
+        window.show()
+        assert _wait_until(
+            lambda: window.history_list_model.rowCount() == HISTORY_PAGE_SIZE
+        )
+
+        # 系统时间被回拨后写入的记录，比第一页里所有记录都旧
+        (old_entry,) = append_entries_to_journal(
+            [
+                JournalEntry(
+                    id=0, timestamp="2024-01-01T00:00:00", mood="calm", text="old"
+                )
+            ],
+            DATABASE_PATH,
+        )
+        window._on_append_succeeded(old_entry)
+        assert window.history_list_model.rowCount() == HISTORY_PAGE_SIZE
+
+        def scrolled_to_end() -> bool:
+            window.history_list.scrollToBottom()
+            return window.history_list_model.rowCount() == total + 1
+
+        assert _wait_until(scrolled_to_end)
+        assert not window._has_more_history
+        ids = _history_ids(window)
+        assert ids[-1] == old_entry.id
+        assert len(set(ids)) == len(ids)
+        assert ids == [entry.id for entry in window._entry_cache.get_all_ordered()]
+    finally:
+        window.quit_application()
+
+
+def test_overlapping_page_does_not_duplicate_rows(window):
+    """测试分页结果与已显示记录重叠时，列表不出现重复行并与缓存保持一致。"""
+    entries = [
+        JournalEntry(
+            id=entry_id,
+            timestamp=f"2025-01-01T10:{entry_id:02d}:00",
+            mood="calm",
+            text=f"entry {entry_id}",
+        )
+        for entry_id in range(5, 0, -1)
+    ]
+    window._on_entries_loaded(entries[:3])
+    window._on_page_loaded(entries[2:])
+
+    ids = _history_ids(window)
+    assert ids == [5, 4, 3, 2, 1]
+    assert ids == [entry.id for entry in window._entry_cache.get_all_ordered()]